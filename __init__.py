@@ -6,6 +6,8 @@ A framework for building reactive event-driven pipelines
 with support for streams, filters, transformations, and async processing.
 """
 
+import asyncio
+
 from .pipeline import Pipeline, PipelineBuilder
 from .event import Event, EventBus, EventHandler
 from .stream import Stream, Source, Sink
@@ -23,3 +25,21 @@ __all__ = [
     "Filter",
     "Predicate",
 ]
+
+
+def _install_fast_loop() -> bool:
+    """
+    Install uvloop as the default event loop policy if it is available.
+
+    Call this once before ``asyncio.run(...)``. ``uvloop.run(coro)`` can be
+    used as a drop-in for ``asyncio.run(coro)`` to the same effect.
+
+    Returns:
+        True if uvloop was installed, False if falling back to asyncio.
+    """
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
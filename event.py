@@ -2,24 +2,36 @@
 Event module for Event-Driven Pipeline.
 
 Provides event system with event bus, handlers, and event types.
+
+Handler failures are reported through the "event_driven_pipeline.event"
+logger. Logging handlers run inline on the event loop, so applications with
+busy buses should route this logger through a logging.handlers.QueueHandler.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Any, Callable, Optional, List
+from typing import Any, Callable, Final, Optional, List, Tuple
 from datetime import datetime
-from enum import Enum
 import asyncio
+import logging
+import time
+
+
+logger = logging.getLogger(__name__)
+
+# Most events handed to publish_many() by the background dispatcher at once.
+MAX_BATCH_SIZE = 256
 
 
-class EventPriority(Enum):
+class EventPriority:
     """Event priority levels."""
-    LOW = 1
-    NORMAL = 2
-    HIGH = 3
-    CRITICAL = 4
+    LOW: Final = 1
+    NORMAL: Final = 2
+    HIGH: Final = 3
+    CRITICAL: Final = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     An event in the pipeline.
@@ -27,25 +39,32 @@ class Event:
     Attributes:
         event_type: Type identifier for the event.
         data: Event payload data.
-        timestamp: When the event was created.
+        timestamp: When the event was created, in nanoseconds since the epoch.
         source: Origin of the event.
-        priority: Event priority.
+        priority: Event priority (one of the EventPriority levels).
         metadata: Additional event metadata.
     """
     event_type: str
     data: Any = None
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)
     source: str = ""
-    priority: EventPriority = EventPriority.NORMAL
+    priority: int = EventPriority.NORMAL
     metadata: dict = field(default_factory=dict)
     
+    @property
+    def datetime(self) -> datetime:
+        """Creation time as a local datetime."""
+        return datetime.fromtimestamp(self.timestamp / 1e9)
+    
     def __repr__(self) -> str:
-        return f"Event(type='{self.event_type}', priority={self.priority.value})"
+        return f"Event(type='{self.event_type}', priority={self.priority})"
 
 
 class EventHandler:
     """Base class for event handlers."""
     
+    __slots__ = ("name", "_filters")
+    
     def __init__(self, name: str = ""):
         self.name = name or self.__class__.__name__
         self._filters: List[Callable[[Event], bool]] = []
@@ -65,12 +84,15 @@ class EventHandler:
 class FuncEventHandler(EventHandler):
     """Event handler that wraps a function."""
     
+    __slots__ = ("func", "_is_coro")
+    
     def __init__(self, func: Callable, name: str = ""):
         super().__init__(name or func.__name__)
         self.func = func
+        self._is_coro = asyncio.iscoroutinefunction(func)
     
     async def handle(self, event: Event) -> Any:
-        if asyncio.iscoroutinefunction(self.func):
+        if self._is_coro:
             return await self.func(event)
         return self.func(event)
 
@@ -78,28 +100,134 @@ class FuncEventHandler(EventHandler):
 class EventBus:
     """Central event bus for publishing and subscribing to events."""
     
-    def __init__(self):
-        self._handlers: dict[str, List[EventHandler]] = {}
+    def __init__(self) -> None:
+        # Each entry is (handler, is_coroutine_function), resolved at subscribe time.
+        self._handlers: dict[str, List[Tuple[Callable, bool]]] = defaultdict(list)
         self._running = False
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
     
     def subscribe(self, event_type: str, handler: Callable) -> None:
         """Subscribe to an event type."""
-        if event_type not in self._handlers:
-            self._handlers[event_type] = []
-        self._handlers[event_type].append(handler)
+        self._handlers[event_type].append((handler, asyncio.iscoroutinefunction(handler)))
     
     async def publish(self, event: Event) -> List[Any]:
         """Publish an event to all subscribers."""
-        handlers = self._handlers.get(event.event_type, [])
+        handlers = self._handlers.get(event.event_type)
+        if not handlers:
+            return []
         results = []
-        for handler in handlers:
+        coros = []
+        for handler, is_coro in handlers:
             try:
-                result = handler(event) if not asyncio.iscoroutinefunction(handler) else await handler(event)
-                results.append(result)
-            except Exception as e:
-                print(f"Handler error: {e}")
+                if is_coro:
+                    coros.append(handler(event))
+                else:
+                    results.append(handler(event))
+            except Exception:
+                logger.exception("Handler error")
+        
+        # Async handlers run concurrently; their results follow the sync ones.
+        if coros:
+            for result in await asyncio.gather(*coros, return_exceptions=True):
+                if isinstance(result, BaseException):
+                    logger.error("Handler error", exc_info=result)
+                else:
+                    results.append(result)
         return results
     
-    def get_handlers(self, event_type: str) -> List[EventHandler]:
+    async def publish_many(self, events: List[Event]) -> List[List[Any]]:
+        """
+        Publish a batch of events.
+        
+        Handlers are resolved once per event type and all async handler calls
+        in the batch share a single gather. Events are dispatched in input
+        order. Returns one result list per event, in the same order and shape
+        as publish().
+        """
+        handlers_by_type: dict[str, List[Tuple[Callable, bool]]] = {}
+        for event in events:
+            if event.event_type not in handlers_by_type:
+                handlers_by_type[event.event_type] = self._handlers.get(event.event_type) or []
+        
+        results: List[List[Any]] = [[] for _ in events]
+        coros = []
+        owners = []
+        for i, event in enumerate(events):
+            for handler, is_coro in handlers_by_type[event.event_type]:
+                try:
+                    if is_coro:
+                        coros.append(handler(event))
+                        owners.append(i)
+                    else:
+                        results[i].append(handler(event))
+                except Exception:
+                    logger.exception("Handler error")
+        
+        if coros:
+            gathered = await asyncio.gather(*coros, return_exceptions=True)
+            for i, result in zip(owners, gathered):
+                if isinstance(result, BaseException):
+                    logger.error("Handler error", exc_info=result)
+                else:
+                    results[i].append(result)
+        return results
+    
+    def start(self) -> None:
+        """
+        Start background dispatch for publish_nowait().
+        
+        Must be called from a running event loop.
+        """
+        if self._running:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._drain(self._queue))
+        self._running = True
+    
+    async def stop(self) -> None:
+        """Stop background dispatch, delivering any events still queued."""
+        queue, worker = self._queue, self._worker
+        if not self._running or queue is None or worker is None:
+            return
+        self._running = False
+        # Stop waiting for the queue to drain if the worker has died.
+        drained = asyncio.ensure_future(queue.join())
+        await asyncio.wait({drained, worker}, return_when=asyncio.FIRST_COMPLETED)
+        drained.cancel()
+        worker.cancel()
+        try:
+            await worker
+        except asyncio.CancelledError:
+            # Only swallow the cancellation we caused, not one aimed at stop().
+            # Cancelling stop() also cancels the awaited worker, so check both.
+            current = asyncio.current_task()
+            if not worker.cancelled() or (current is not None and current.cancelling()):
+                raise
+        except Exception:
+            logger.exception("Event dispatcher failed")
+        self._worker = None
+        self._queue = None
+    
+    def publish_nowait(self, event: Event) -> None:
+        """Queue an event for background dispatch (see start())."""
+        if not self._running or self._queue is None:
+            raise RuntimeError("EventBus is not started")
+        self._queue.put_nowait(event)
+    
+    async def _drain(self, queue: asyncio.Queue) -> None:
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty() and len(batch) < MAX_BATCH_SIZE:
+                batch.append(queue.get_nowait())
+            try:
+                await self.publish_many(batch)
+            except Exception:
+                logger.exception("Event dispatch failed")
+            finally:
+                for _ in batch:
+                    queue.task_done()
+    
+    def get_handlers(self, event_type: str) -> List[Callable]:
         """Get handlers for an event type."""
-        return self._handlers.get(event_type, [])
+        return [handler for handler, _ in self._handlers.get(event_type, [])]
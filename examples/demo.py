@@ -2,14 +2,18 @@
 Demo examples for the Event-Driven Pipeline.
 
 Demonstrates event bus, pipelines, and stream processing.
+
+Each demo runs its coroutine with ``asyncio.run``. With uvloop installed,
+``_install_fast_loop()`` swaps in the uvloop policy up front; alternatively
+``uvloop.run(coro)`` is a drop-in replacement for ``asyncio.run(coro)``.
 """
 
 import asyncio
 from event_driven_pipeline import (
     Event, EventBus, Pipeline, PipelineBuilder,
-    Stream, ListSource, PrintSink
+    Stream, _install_fast_loop
 )
-from event_driven_pipeline.stream import process_stream
+from event_driven_pipeline.stream import ListSource, PrintSink, process_stream
 
 
 # =============================================================================
@@ -107,6 +111,15 @@ def demo_stream():
     
     print(f"Original: [1,2,3,4,5,6,7,8,9,10]")
     print(f"Filtered (even) and doubled: {list(result)}")
+    
+    # Vectorized variant: on array-backed streams vfilter/vmap run as NumPy
+    # operations over the whole array instead of per-element lambdas.
+    try:
+        numbers = Stream.from_array(range(1, 11))
+    except ImportError:
+        return
+    result = numbers.vfilter(lambda a: a % 2 == 0).vmap(lambda a: a * 2)
+    print(f"Vectorized (even) and doubled: {asyncio.run(result.collect())}")
 
 
 # =============================================================================
@@ -128,7 +141,9 @@ def demo_async_stream():
         return x * 2
     
     async def run():
-        results = await process_stream(source, double, PrintSink(prefix="Result: "))
+        results = await process_stream(
+            source, double, sink=PrintSink(prefix="Result: "), concurrency=5
+        )
         print(f"Processed {len(results)} items")
     
     asyncio.run(run())
@@ -189,6 +204,8 @@ def demo_complex_pipeline():
 # =============================================================================
 
 if __name__ == "__main__":
+    _install_fast_loop()
+    
     demo_event_bus()
     demo_pipeline()
     demo_stream()
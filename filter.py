@@ -4,12 +4,19 @@ Filter module for Event-Driven Pipeline.
 Provides filter and predicate utilities for stream processing.
 """
 
+from functools import partial
 from typing import Any, Callable
+import operator
+import re
 
 
 class Predicate:
     """Base class for filter predicates."""
     
+    __slots__ = ("func",)
+    
+    func: Callable[[Any], bool]
+    
     def __init__(self, func: Callable[[Any], bool]):
         self.func = func
     
@@ -29,9 +36,42 @@ class Predicate:
         return Predicate(lambda x: not self(x))
 
 
+def _gt(value: Any) -> Callable[[Any], bool]:
+    def f(x: Any) -> bool:
+        return x > value
+    return f
+
+
+def _lt(value: Any) -> Callable[[Any], bool]:
+    def f(x: Any) -> bool:
+        return x < value
+    return f
+
+
+def _hyperscan_search(pattern: str) -> Callable[[Any], bool]:
+    import hyperscan  # type: ignore[import-not-found]
+    
+    db = hyperscan.Database()
+    db.compile(expressions=[pattern.encode()], flags=[hyperscan.HS_FLAG_SINGLEMATCH])
+    
+    def on_match(match_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        context.append(True)
+    
+    def search(x: Any) -> bool:
+        found: list = []
+        db.scan(str(x).encode(), match_event_handler=on_match, context=found)
+        return bool(found)
+    
+    return search
+
+
 class Filter:
     """Filter for stream processing."""
     
+    __slots__ = ("predicate",)
+    
+    predicate: Callable[[Any], bool]
+    
     def __init__(self, predicate: Callable[[Any], bool]):
         self.predicate = predicate
     
@@ -42,33 +82,42 @@ class Filter:
     @staticmethod
     def equals(value: Any) -> Predicate:
         """Filter equals value."""
-        return Predicate(lambda x: x == value)
+        return Predicate(partial(operator.eq, value))
     
     @staticmethod
     def not_equals(value: Any) -> Predicate:
         """Filter not equals value."""
-        return Predicate(lambda x: x != value)
+        return Predicate(partial(operator.ne, value))
     
     @staticmethod
     def greater_than(value: Any) -> Predicate:
         """Filter greater than."""
-        return Predicate(lambda x: x > value)
+        return Predicate(_gt(value))
     
     @staticmethod
     def less_than(value: Any) -> Predicate:
         """Filter less than."""
-        return Predicate(lambda x: x < value)
+        return Predicate(_lt(value))
     
     @staticmethod
     def contains(substring: str) -> Predicate:
         """Filter contains substring."""
+        substring = str(substring)
         return Predicate(lambda x: substring in str(x))
     
     @staticmethod
-    def matches(pattern: str) -> Predicate:
-        """Filter matches regex pattern."""
-        import re
-        return Predicate(lambda x: bool(re.search(pattern, str(x))))
+    def matches(pattern: str, use_hyperscan: bool = False) -> Predicate:
+        """
+        Filter matches regex pattern.
+        
+        The pattern is compiled once. With use_hyperscan=True it is compiled
+        into a Hyperscan database (requires the hyperscan package), which
+        scans long inputs without regex backtracking.
+        """
+        if use_hyperscan:
+            return Predicate(_hyperscan_search(pattern))
+        search = re.compile(pattern).search
+        return Predicate(lambda x: search(x if isinstance(x, str) else str(x)) is not None)
 
 
 # Common predicates
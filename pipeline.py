@@ -4,24 +4,28 @@ Pipeline module for Event-Driven Pipeline.
 Provides pipeline construction and execution with stages, transformations, and async support.
 """
 
-from typing import Any, Callable, List, Optional
-from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
 import asyncio
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     """A single stage in the pipeline."""
     name: str
     handler: Callable
     condition: Optional[Callable[[Any], bool]] = None
+    _is_async: bool = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._is_async = asyncio.iscoroutinefunction(self.handler)
     
     async def execute(self, data: Any) -> Any:
         """Execute the stage handler."""
-        if self.condition and not self.condition(data):
+        if self.condition is not None and not self.condition(data):
             return data
         
-        if asyncio.iscoroutinefunction(self.handler):
+        if self._is_async:
             return await self.handler(data)
         return self.handler(data)
 
@@ -41,7 +45,8 @@ class Pipeline:
     
     def __init__(self, name: str = "pipeline"):
         self.name = name
-        self.stages: List[PipelineStage] = []
+        self.stages: Union[List[PipelineStage], Tuple[PipelineStage, ...]] = []
+        self._frozen = False
     
     def add_stage(
         self,
@@ -50,17 +55,52 @@ class Pipeline:
         condition: Optional[Callable] = None
     ) -> "Pipeline":
         """Add a stage to the pipeline."""
+        if self._frozen:
+            raise RuntimeError(f"Pipeline '{self.name}' is frozen")
         stage = PipelineStage(name=name, handler=handler, condition=condition)
+        if isinstance(self.stages, tuple):
+            self.stages = list(self.stages)
         self.stages.append(stage)
         return self
     
     async def execute(self, initial_data: Any) -> Any:
-        """Execute all stages in sequence."""
+        """
+        Execute all stages in sequence.
+        
+        For pipelines without async stages, execute_sync() gives the same
+        result without going through the event loop.
+        """
+        data = initial_data
+        # Inlined PipelineStage.execute: sync handlers are called directly
+        # without creating a coroutine per stage.
+        for stage in self.stages:
+            if stage.condition is not None and not stage.condition(data):
+                continue
+            if stage._is_async:
+                data = await stage.handler(data)
+            else:
+                data = stage.handler(data)
+        return data
+    
+    def execute_sync(self, initial_data: Any) -> Any:
+        """Execute all stages in sequence; every stage must be synchronous."""
+        # Checked up front from the stages themselves, since stages is public
+        # and may be reassigned; no stage runs if any of them is async.
+        if any(stage._is_async for stage in self.stages):
+            raise RuntimeError(f"Pipeline '{self.name}' has async stages; use execute()")
         data = initial_data
         for stage in self.stages:
-            data = await stage.execute(data)
+            if stage.condition is not None and not stage.condition(data):
+                continue
+            data = stage.handler(data)
         return data
     
+    def freeze(self) -> "Pipeline":
+        """Fix the stage list; add_stage() raises afterwards."""
+        self.stages = tuple(self.stages)
+        self._frozen = True
+        return self
+    
     def __repr__(self) -> str:
         return f"Pipeline(name='{self.name}', stages={len(self.stages)})"
 
@@ -81,4 +121,5 @@ class PipelineBuilder:
         """Build the pipeline."""
         pipeline = Pipeline(name=self.name)
         pipeline.stages = self._stages
+        pipeline.freeze()
         return pipeline
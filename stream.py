@@ -4,57 +4,215 @@ Stream module for Event-Driven Pipeline.
 Provides stream processing with sources, transformations, and sinks.
 """
 
-from typing import Any, Callable, List, Optional, AsyncIterator, Iterable
+from typing import Any, Callable, List, Optional, AsyncIterator, Iterable, Iterator
 import asyncio
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import reduce
+from types import FunctionType
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None  # type: ignore[assignment]
+
+try:
+    import numba
+except ImportError:  # optional dependency
+    numba = None  # type: ignore[assignment]
 
 
 class Stream:
     """
     A stream of data that can be transformed.
     
+    Transformations are lazy: chained map/filter/flat_map calls are fused
+    into a single pass over the data when the stream is consumed. A stream
+    built from transformations can be consumed once; call materialize()
+    to keep the results around for repeated or random access.
+    
     Example:
         stream = Stream([1, 2, 3, 4, 5])
         result = await stream.map(lambda x: x * 2).filter(lambda x: x > 5).collect()
     """
     
+    __slots__ = ("_data",)
+    
     def __init__(self, data: Optional[Iterable] = None):
-        self._data = data or []
+        self._data = data if data is not None else []
     
     def map(self, func: Callable) -> "Stream":
         """Transform each element."""
-        return Stream([func(x) for x in self._data])
+        return Stream(map(func, self._data))
     
     def filter(self, predicate: Callable) -> "Stream":
         """Filter elements."""
-        return Stream([x for x in self._data if predicate(x)])
+        return Stream(filter(predicate, self._data))
     
     def flat_map(self, func: Callable) -> "Stream":
         """Flatten nested results."""
-        result = []
-        for x in self._data:
-            r = func(x)
-            if hasattr(r, '__iter__') and not isinstance(r, (str, bytes)):
-                result.extend(r)
-            else:
-                result.append(r)
-        return Stream(result)
+        return Stream(_flatten(func, self._data))
+    
+    @classmethod
+    def from_array(cls, array: Any) -> "Stream":
+        """Create a stream backed by a NumPy array (requires numpy)."""
+        if np is None:
+            raise ImportError("Stream.from_array requires numpy")
+        return cls(np.asarray(array))
+    
+    def vmap(self, ufunc: Callable) -> "Stream":
+        """
+        Transform elements with a vectorized function.
+        
+        On array-backed streams ufunc is applied to the whole array at once;
+        otherwise it is applied per element like map().
+        """
+        if np is not None and isinstance(self._data, np.ndarray):
+            return Stream(ufunc(self._data))
+        return self.map(ufunc)
+    
+    def vfilter(self, mask_func: Callable) -> "Stream":
+        """
+        Filter elements with a vectorized predicate.
+        
+        On array-backed streams mask_func receives the whole array and must
+        return a boolean mask; otherwise it is applied per element like filter().
+        """
+        if np is not None and isinstance(self._data, np.ndarray):
+            return Stream(self._data[mask_func(self._data)])
+        return self.filter(mask_func)
+    
+    async def parallel_map(self, func: Callable, workers: int = 8) -> "Stream":
+        """
+        Transform each element in worker threads.
+        
+        Meant for blocking, I/O-bound callbacks; at most `workers` calls run
+        at once. Element order is preserved.
+        """
+        sem = asyncio.Semaphore(workers)
+        
+        async def run(x: Any) -> Any:
+            async with sem:
+                return await asyncio.to_thread(func, x)
+        
+        return Stream(await asyncio.gather(*(run(x) for x in self._data)))
+    
+    async def cpu_map(
+        self,
+        func: Callable,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None
+    ) -> "Stream":
+        """
+        Transform each element in a process pool.
+        
+        Meant for CPU-bound callbacks; func and the elements must be
+        picklable. Element order is preserved. Pass a long-lived `executor`
+        to reuse worker processes across calls; otherwise a pool of
+        `workers` processes is started for this call only.
+        """
+        loop = asyncio.get_running_loop()
+        pool = executor or ProcessPoolExecutor(max_workers=workers)
+        try:
+            results = await asyncio.gather(
+                *(loop.run_in_executor(pool, func, x) for x in self._data)
+            )
+        finally:
+            # Never block the event loop on worker shutdown; pending work
+            # is dropped if the call was cancelled or failed.
+            if executor is None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        return Stream(results)
+    
+    def jit_reduce(self, fn: Callable[[Any, Any], Any], init: Any) -> Any:
+        """
+        Fold numeric data with a Numba-compiled reducer.
+        
+        fn(acc, x) is compiled with numba.njit on the first call for that
+        function, which can take hundreds of milliseconds; later calls reuse
+        the compiled loop. Use it on hot paths that reduce large numeric
+        streams repeatedly, not for one-off reductions. Falls back to
+        functools.reduce when numba is not installed, when fn is not a plain
+        Python function (e.g. operator.add or a functools.partial), or when
+        numba cannot compile it. Returns init for an empty stream.
+        """
+        if numba is None or not isinstance(fn, FunctionType):
+            return reduce(fn, self._data, init)
+        data = self._data
+        items = data if isinstance(data, np.ndarray) else list(data)
+        if len(items) == 0:
+            return init
+        if fn in _jit_folds:
+            fold = _jit_folds[fn]
+        else:
+            fold = _jit_folds[fn] = _make_jit_fold(fn)
+        if fold is not None:
+            try:
+                return fold(np.asarray(items), init)
+            except numba.core.errors.NumbaError:
+                _jit_folds[fn] = None
+        return reduce(fn, items, init)
+    
+    def materialize(self) -> "Stream":
+        """
+        Evaluate pending transformations into a list held by this stream.
+        
+        Array-backed streams already support random access and are left as is.
+        """
+        if np is not None and isinstance(self._data, np.ndarray):
+            return self
+        if not isinstance(self._data, list):
+            self._data = list(self._data)
+        return self
     
     async def collect(self) -> List[Any]:
         """Collect stream to list."""
-        return self._data
+        if np is not None and isinstance(self._data, np.ndarray):
+            return self._data.tolist()
+        return list(self._data)
     
     def __iter__(self):
         return iter(self._data)
 
 
+# Compiled folds keyed by reducer; entries go away with the reducer function.
+# None marks reducers numba failed to compile.
+_jit_folds: "weakref.WeakKeyDictionary[Callable, Optional[Callable]]" = weakref.WeakKeyDictionary()
+
+
+def _make_jit_fold(fn: Callable) -> Callable:
+    try:
+        step = numba.njit(cache=True)(fn)
+    except RuntimeError:
+        # No on-disk cache for functions defined in a REPL or exec().
+        step = numba.njit(fn)
+    
+    @numba.njit
+    def fold(values, acc):
+        for x in values:
+            acc = step(acc, x)
+        return acc
+    
+    return fold
+
+
+def _flatten(func: Callable, data: Iterable) -> Iterator[Any]:
+    for x in data:
+        r = func(x)
+        if hasattr(r, '__iter__') and not isinstance(r, (str, bytes)):
+            yield from r
+        else:
+            yield r
+
+
 class Source:
     """Data source for streams."""
     
     def __init__(self, name: str = "source"):
         self.name = name
     
-    async def produce(self) -> AsyncIterator[Any]:
-        """Produce data (override in subclass)."""
+    def produce(self) -> AsyncIterator[Any]:
+        """Produce data (override in subclass with an async generator)."""
         raise NotImplementedError
 
 
@@ -79,6 +237,9 @@ class ListSource(Source):
     async def produce(self) -> AsyncIterator[Any]:
         for item in self.items:
             yield item
+    
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.items)
 
 
 class PrintSink(Sink):
@@ -95,15 +256,27 @@ class PrintSink(Sink):
 async def process_stream(
     source: Source,
     *processors: Callable,
-    sink: Optional[Sink] = None
+    sink: Optional[Sink] = None,
+    concurrency: int = 16
 ) -> List[Any]:
-    """Process a stream through processors to a sink."""
-    results = []
+    """
+    Process a stream through processors to a sink.
     
-    async for item in source.produce():
+    Up to `concurrency` worker coroutines pull items from the source and
+    process them concurrently, so the source is read only as fast as items
+    complete. Results are returned in source order; the sink receives items
+    as they complete. With concurrency=1, or when no processor is async,
+    items are processed one at a time in source order. If a processor or the
+    sink raises, the workers are cancelled and the exception is re-raised.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    steps = [(proc, asyncio.iscoroutinefunction(proc)) for proc in processors]
+    
+    async def process_one(item: Any) -> Any:
         data = item
-        for proc in processors:
-            if asyncio.iscoroutinefunction(proc):
+        for proc, is_async in steps:
+            if is_async:
                 data = await proc(data)
             else:
                 data = proc(data)
@@ -111,6 +284,57 @@ async def process_stream(
         if sink:
             await sink.consume(data)
         
-        results.append(data)
+        return data
+    
+    # Plain list sources are iterated directly, skipping the async generator,
+    # unless a subclass customises produce().
+    direct: Optional[Iterator[Any]] = None
+    if isinstance(source, ListSource) and type(source).produce is ListSource.produce:
+        direct = iter(source)
+    else:
+        items = source.produce()
+    
+    if concurrency == 1 or not any(is_async for _, is_async in steps):
+        if direct is not None:
+            return [await process_one(item) for item in direct]
+        return [await process_one(item) async for item in items]
+    
+    results: dict[int, Any] = {}
+    lock = asyncio.Lock()
+    next_index = 0
+    failed = False
+    
+    async def worker() -> None:
+        nonlocal next_index, failed
+        while not failed:
+            if direct is not None:
+                try:
+                    item = next(direct)
+                except StopIteration:
+                    return
+                index = next_index
+                next_index += 1
+            else:
+                # Async generators do not allow overlapping __anext__ calls.
+                async with lock:
+                    try:
+                        item = await items.__anext__()
+                    except StopAsyncIteration:
+                        return
+                    index = next_index
+                    next_index += 1
+            try:
+                results[index] = await process_one(item)
+            except BaseException:
+                failed = True
+                raise
     
-    return results
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    try:
+        await asyncio.gather(*workers)
+    except BaseException:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        raise
+    return [results[i] for i in range(len(results))]
@@ -0,0 +1,17 @@
+"""Make the repository root importable as the event_driven_pipeline package."""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if "event_driven_pipeline" not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        "event_driven_pipeline",
+        ROOT / "__init__.py",
+        submodule_search_locations=[str(ROOT)],
+    )
+    package = importlib.util.module_from_spec(spec)
+    sys.modules["event_driven_pipeline"] = package
+    spec.loader.exec_module(package)
@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from event_driven_pipeline.event import Event, EventBus
+
+
+def test_publish_logs_handler_that_fails_to_start(caplog) -> None:
+    bus = EventBus()
+
+    async def good(event):
+        return "ok"
+
+    async def bad():
+        return "never"
+
+    bus.subscribe("t", good)
+    bus.subscribe("t", bad)
+
+    assert asyncio.run(bus.publish(Event("t"))) == ["ok"]
+    assert "Handler error" in caplog.text
+
+
+def test_publish_runs_sync_then_async_handlers() -> None:
+    bus = EventBus()
+
+    async def slow(event):
+        await asyncio.sleep(0)
+        return "async"
+
+    def fast(event):
+        return "sync"
+
+    def broken(event):
+        raise ValueError("boom")
+
+    bus.subscribe("t", slow)
+    bus.subscribe("t", broken)
+    bus.subscribe("t", fast)
+
+    assert asyncio.run(bus.publish(Event("t"))) == ["sync", "async"]
+    assert asyncio.run(bus.publish(Event("other"))) == []
+
+
+def test_publish_many_keeps_batch_when_handler_fails_to_start(caplog) -> None:
+    bus = EventBus()
+
+    async def echo(event):
+        return event.data
+
+    async def bad():
+        return "never"
+
+    bus.subscribe("a", echo)
+    bus.subscribe("b", bad)
+
+    events = [Event("a", data=1), Event("b"), Event("missing"), Event("a", data=2)]
+    assert asyncio.run(bus.publish_many(events)) == [[1], [], [], [2]]
+    assert "Handler error" in caplog.text
+
+
+def test_publish_nowait_delivers_before_stop() -> None:
+    received = []
+
+    async def handler(event):
+        await asyncio.sleep(0)
+        received.append(event.data)
+
+    async def main():
+        bus = EventBus()
+        bus.subscribe("t", handler)
+        bus.start()
+        for i in range(600):
+            bus.publish_nowait(Event("t", data=i))
+        await bus.stop()
+
+    asyncio.run(main())
+    assert sorted(received) == list(range(600))
+
+
+def test_stop_after_handler_failure() -> None:
+    received = []
+
+    async def bad():
+        return "never"
+
+    async def handler(event):
+        received.append(event.data)
+
+    async def main():
+        bus = EventBus()
+        bus.subscribe("t", bad)
+        bus.subscribe("t", handler)
+        bus.start()
+        bus.publish_nowait(Event("t", data=1))
+        await asyncio.sleep(0.01)
+        bus.publish_nowait(Event("t", data=2))
+        await asyncio.wait_for(bus.stop(), timeout=1)
+
+    asyncio.run(main())
+    assert received == [1, 2]
+
+
+def test_stop_returns_when_dispatcher_is_gone() -> None:
+    async def main():
+        bus = EventBus()
+        bus.start()
+        bus._worker.cancel()
+        await asyncio.sleep(0)
+        bus.publish_nowait(Event("t"))
+        await asyncio.wait_for(bus.stop(), timeout=1)
+
+    asyncio.run(main())
+
+
+def test_publish_many_dispatches_in_input_order() -> None:
+    bus = EventBus()
+    seen = []
+
+    def record(event):
+        seen.append(event.data)
+        return event.data
+
+    bus.subscribe("a", record)
+    bus.subscribe("b", record)
+
+    events = [Event("a", data=1), Event("b", data=2), Event("a", data=3)]
+    assert asyncio.run(bus.publish_many(events)) == [[1], [2], [3]]
+    assert seen == [1, 2, 3]
+
+
+def test_stop_propagates_its_own_cancellation() -> None:
+    async def slow_to_cancel():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.05)
+
+    async def main():
+        bus = EventBus()
+        bus.start()
+        bus._worker.cancel()
+        bus._worker = asyncio.create_task(slow_to_cancel())
+        await asyncio.sleep(0)
+        stopping = asyncio.create_task(bus.stop())
+        await asyncio.sleep(0.01)
+        stopping.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await stopping
+
+    asyncio.run(main())
@@ -0,0 +1,47 @@
+import pytest
+
+from event_driven_pipeline.filter import Filter
+
+
+def test_equals_and_not_equals() -> None:
+    assert Filter.equals("a")("a")
+    assert not Filter.equals("a")("b")
+    assert Filter.equals(3)(3.0)
+    assert not Filter.equals(3)("3")
+    assert Filter.not_equals(3)("3")
+    assert not Filter.not_equals("a")("a")
+
+
+def test_greater_than_and_less_than() -> None:
+    assert Filter.greater_than(2)(3)
+    assert not Filter.greater_than(2)(2)
+    assert Filter.greater_than("b")("c")
+    assert Filter.less_than(2)(1.5)
+    assert not Filter.less_than("b")("c")
+    with pytest.raises(TypeError):
+        Filter.greater_than(2)("3")
+
+
+def test_contains_converts_values_to_str() -> None:
+    assert Filter.contains("ell")("hello")
+    assert not Filter.contains("xyz")("hello")
+    assert Filter.contains("12")(3123)
+    assert Filter.contains(12)("a12b")
+    assert Filter.contains("None")(None)
+
+
+def test_matches() -> None:
+    predicate = Filter.matches(r"\d{2}")
+    assert predicate("ab12") is True
+    assert predicate("a1b2") is False
+    assert predicate(1234) is True
+    assert predicate(None) is False
+
+
+def test_matches_with_hyperscan() -> None:
+    pytest.importorskip("hyperscan")
+    predicate = Filter.matches(r"\d{2}", use_hyperscan=True)
+    assert predicate("ab12") is True
+    assert predicate("a1b2") is False
+    assert predicate(1234) is True
+    assert predicate("x" * 10_000 + "42") is True
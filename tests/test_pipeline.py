@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from event_driven_pipeline.pipeline import Pipeline, PipelineBuilder, PipelineStage
+
+
+def test_built_pipeline_is_frozen() -> None:
+    pipeline = PipelineBuilder("p").stage("inc", lambda x: x + 1).build()
+
+    assert pipeline.stages == tuple(pipeline.stages)
+    assert pipeline.execute_sync(1) == 2
+    with pytest.raises(RuntimeError, match="frozen"):
+        pipeline.add_stage("double", lambda x: x * 2)
+
+
+def test_assigned_tuple_does_not_freeze() -> None:
+    pipeline = Pipeline("p")
+    pipeline.stages = PipelineBuilder().stage("inc", lambda x: x + 1).build().stages
+    pipeline.add_stage("double", lambda x: x * 2)
+
+    assert asyncio.run(pipeline.execute(1)) == 4
+
+
+def test_execute_sync_honours_conditions() -> None:
+    pipeline = (
+        Pipeline("p")
+        .add_stage("inc", lambda x: x + 1)
+        .add_stage("big", lambda x: x * 100, condition=lambda x: x > 10)
+        .add_stage("double", lambda x: x * 2)
+    )
+
+    assert pipeline.execute_sync(1) == 4
+    assert pipeline.execute_sync(10) == 2200
+    assert asyncio.run(pipeline.execute(1)) == 4
+
+
+def test_execute_sync_rejects_async_stages() -> None:
+    calls = []
+
+    async def fetch(x):
+        return x
+
+    pipeline = Pipeline("p").add_stage("log", calls.append).add_stage("fetch", fetch)
+    with pytest.raises(RuntimeError, match="async stages"):
+        pipeline.execute_sync(1)
+    assert calls == []
+
+    pipeline = Pipeline("q")
+    pipeline.stages = [PipelineStage("fetch", fetch)]
+    with pytest.raises(RuntimeError, match="async stages"):
+        pipeline.execute_sync(1)
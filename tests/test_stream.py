@@ -0,0 +1,182 @@
+import asyncio
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import pytest
+
+from event_driven_pipeline.stream import ListSource, Sink, Source, Stream, process_stream
+
+
+def test_chained_transformations_run_lazily() -> None:
+    seen = []
+
+    def record(x):
+        seen.append(x)
+        return x * 2
+
+    stream = Stream([1, 2, 3, 4]).filter(lambda x: x % 2 == 0).map(record)
+    assert seen == []
+    assert asyncio.run(stream.collect()) == [4, 8]
+    assert seen == [2, 4]
+    assert asyncio.run(stream.collect()) == []
+
+
+def test_flat_map_flattens_iterables_but_not_strings() -> None:
+    stream = Stream([1, 2, 3]).flat_map(lambda x: [x] * x if x < 3 else "ab")
+    assert list(stream) == [1, 2, 2, "ab"]
+
+
+def test_materialize_allows_repeated_reads() -> None:
+    stream = Stream(iter([1, 2, 3])).map(lambda x: x + 1).materialize()
+    assert list(stream) == [2, 3, 4]
+    assert asyncio.run(stream.collect()) == [2, 3, 4]
+
+
+def test_vectorized_ops_collect_to_python_values() -> None:
+    pytest.importorskip("numpy")
+    stream = Stream.from_array(range(1, 11))
+    result = stream.vfilter(lambda a: a % 2 == 0).vmap(lambda a: a * 2)
+    collected = asyncio.run(result.collect())
+    assert collected == [4, 8, 12, 16, 20]
+    assert all(type(x) is int for x in collected)
+
+
+def test_materialize_keeps_array_backing() -> None:
+    np = pytest.importorskip("numpy")
+    stream = Stream.from_array([1, 2, 3]).materialize()
+    assert isinstance(stream._data, np.ndarray)
+    assert isinstance(stream.vmap(lambda a: a + 1)._data, np.ndarray)
+
+
+def test_vectorized_ops_fall_back_per_element() -> None:
+    result = Stream([1, 2, 3, 4]).vfilter(lambda x: x % 2 == 0).vmap(lambda x: x * 2)
+    assert asyncio.run(result.collect()) == [4, 8]
+
+
+def _add(acc, x):
+    return acc + x
+
+
+def _scaled_add(factor, acc, x):
+    return acc + factor * x
+
+
+def test_jit_reduce_over_lazy_stream() -> None:
+    pytest.importorskip("numba")
+    stream = Stream([1, 2, 3, 4]).map(lambda x: x * 2)
+    assert stream.jit_reduce(_add, 0) == 20
+    assert Stream.from_array([1.5, 2.5]).jit_reduce(_add, 0.0) == 4.0
+
+
+def test_jit_reduce_falls_back_for_uncompilable_reducers() -> None:
+    pytest.importorskip("numba")
+    assert Stream([1, 2, 3]).jit_reduce(operator.add, 0) == 6
+    assert Stream([1, 2, 3]).jit_reduce(partial(_scaled_add, 2), 0) == 12
+    assert Stream([1, 2, 3]).jit_reduce(eval("lambda acc, x: acc + x"), 0) == 6
+    assert Stream(["a", "b"]).jit_reduce(_add, "") == "ab"
+
+
+def test_jit_reduce_empty_stream_returns_init() -> None:
+    pytest.importorskip("numba")
+    result = Stream([]).jit_reduce(_add, 0)
+    assert result == 0 and type(result) is int
+
+
+def test_jit_reduce_without_numba(monkeypatch) -> None:
+    from event_driven_pipeline import stream as stream_module
+
+    monkeypatch.setattr(stream_module, "numba", None)
+    assert Stream([1, 2, 3]).map(lambda x: x * 2).jit_reduce(_add, 0) == 12
+
+
+class CountingSource(Source):
+    """Endless source that records how many items it has produced."""
+
+    def __init__(self):
+        super().__init__("counting")
+        self.produced = 0
+
+    async def produce(self):
+        while True:
+            self.produced += 1
+            yield self.produced
+
+
+def test_process_stream_keeps_source_order() -> None:
+    async def delay(x):
+        await asyncio.sleep(0.01 * (5 - x))
+        return x * 2
+
+    results = asyncio.run(process_stream(ListSource([1, 2, 3, 4, 5]), delay, concurrency=5))
+    assert results == [2, 4, 6, 8, 10]
+
+
+def test_process_stream_stops_on_error() -> None:
+    processed = []
+
+    async def work(x):
+        if x == 0:
+            raise ValueError("bad item")
+        await asyncio.sleep(0.01)
+        processed.append(x)
+        return x
+
+    async def main():
+        with pytest.raises(ValueError, match="bad item"):
+            await process_stream(ListSource([0, 1, 2, 3, 4]), work, concurrency=5)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(main())
+    assert processed == []
+
+
+def test_process_stream_bounds_reads_from_source() -> None:
+    source = CountingSource()
+
+    async def work(x):
+        await asyncio.sleep(0)
+        if x == 50:
+            raise ValueError("stop")
+        return x
+
+    with pytest.raises(ValueError, match="stop"):
+        asyncio.run(process_stream(source, work, concurrency=4))
+    assert source.produced <= 50 + 4
+
+
+def test_process_stream_uses_overridden_produce() -> None:
+    class Upper(ListSource):
+        async def produce(self):
+            for item in self.items:
+                yield item.upper()
+
+    assert asyncio.run(process_stream(Upper(["a", "b"]))) == ["A", "B"]
+    assert asyncio.run(process_stream(ListSource(["a", "b"]))) == ["a", "b"]
+
+
+def test_cpu_map_with_shared_executor() -> None:
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        async def main():
+            first = await Stream([1, 2, 3]).cpu_map(abs, executor=pool)
+            second = await Stream([-4, -5]).cpu_map(abs, executor=pool)
+            return list(first), list(second)
+
+        assert asyncio.run(main()) == ([1, 2, 3], [4, 5])
+
+
+def test_process_stream_serial_keeps_sink_order() -> None:
+    consumed = []
+
+    class ListSink(Sink):
+        async def consume(self, data):
+            consumed.append(data)
+
+    async def delay(x):
+        await asyncio.sleep(0.01 * (3 - x))
+        return x
+
+    results = asyncio.run(
+        process_stream(ListSource([1, 2, 3]), delay, sink=ListSink(), concurrency=1)
+    )
+    assert results == consumed == [1, 2, 3]